@@ -1,15 +1,66 @@
+import io
 import logging
 import os
+import sys
+import threading
+import time
+import weakref
+from functools import lru_cache
 from logging import Logger
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Dict, Literal, NamedTuple, Optional, Tuple, Union
 
+# process ID used in the log file name of unnamed loggers.
+_PID = os.getpid()
 
-def any_case_env_var(var: str, default: Optional[str] = None) -> Union[str, None]:
-    value = os.getenv(var) or os.getenv(var.lower()) or os.getenv(var.upper())
-    if value is None:
+
+def _update_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_update_pid)
+
+
+# level name (uppercase or lowercase) -> level number.
+_LEVELS = {
+    **logging._nameToLevel,
+    **{k.lower(): v for k, v in logging._nameToLevel.items()},
+}
+
+
+def _case_insensitive_env(prefixes: Tuple[str, ...] = ()) -> Dict[str, Dict[str, str]]:
+    """Snapshot of `os.environ` grouped by case-folded variable name.
+
+    Maps each case-folded name to the `{variable name: value}` of every spelling of it.
+    If `prefixes` is given, only variables starting with one of the (case-folded) prefixes are included.
+    """
+    prefixes = tuple(p.casefold() for p in prefixes)
+    env = {}
+    for k, v in os.environ.items():
+        if (kf := k.casefold()).startswith(prefixes):
+            env.setdefault(kf, {})[k] = v
+    return env
+
+
+def any_case_env_var(
+    var: str,
+    default: Optional[str] = None,
+    env: Optional[Dict[str, Dict[str, str]]] = None,
+) -> Union[str, None]:
+    if env is None:
+        env = _case_insensitive_env()
+    if not (spellings := env.get(var.casefold())):
         return default
+    # prefer the exact spelling, then lowercase, then uppercase, then any mixed case spelling.
+    value = (
+        spellings.get(var)
+        or spellings.get(var.lower())
+        or spellings.get(var.upper())
+        or next(iter(spellings.values()))
+    )
     if (vl := value.lower()) == "true":
         return True
     if vl == "false":
@@ -17,14 +68,263 @@ def any_case_env_var(var: str, default: Optional[str] = None) -> Union[str, None
     return value
 
 
+class _DeferredFlush:
+    """Handler mixin that skips the stream flush after each record. Flushing is done by a `_FlushTimer`."""
+
+    _in_emit = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+
+    def flush(self) -> None:
+        # `emit` holds the (reentrant) handler lock, so only the emitting thread can see `_in_emit` set.
+        # flushes from other threads wait for the record to be written and then flush.
+        with self.lock:
+            if not self._in_emit:
+                super().flush()
+
+
+class _StreamHandler(logging.StreamHandler):
+    """`StreamHandler` that writes encoded records straight to a terminal's file descriptor.
+
+    This bypasses the text wrapper's encoder and per-record flush. Only used for a plain `io.TextIOWrapper` attached to a terminal on non-Windows platforms.
+    Redirected, captured, or wrapped streams (and Windows consoles, which rely on the wrapper's newline and code page handling) are written to normally.
+    """
+
+    def __init__(self, stream=None) -> None:
+        super().__init__(stream)
+        self._set_fd()
+
+    def _set_fd(self) -> None:
+        self._fd = None
+        if os.name == "nt" or type(self.stream) is not io.TextIOWrapper:
+            return
+        try:
+            if self.stream.isatty():
+                self._fd = self.stream.fileno()
+        except (OSError, ValueError):
+            pass
+
+    def setStream(self, stream):
+        old = super().setStream(stream)
+        self._set_fd()
+        return old
+
+    def emit(self, record: logging.LogRecord) -> None:
+        stream = self.stream
+        if self._fd is None or stream.closed:
+            # a closed stream's descriptor may have been reused, so let the normal path raise through `handleError`.
+            return super().emit(record)
+        try:
+            data = (self.format(record) + self.terminator).encode(
+                stream.encoding, stream.errors
+            )
+            # write out anything the text wrapper has buffered first, so output stays in order.
+            stream.flush()
+            while data:
+                data = data[os.write(self._fd, data) :]
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _DeferredFlushStreamHandler(_DeferredFlush, _StreamHandler):
+    pass
+
+
+class _RotatingFileHandler(RotatingFileHandler):
+    """`RotatingFileHandler` that formats each record once instead of twice.
+
+    `shouldRollover` formats the record to measure its size, then `emit` formats it again to write it (CPython #116267).
+    """
+
+    _formatted: Optional[Tuple[logging.LogRecord, str]] = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self._formatted is not None and self._formatted[0] is record:
+            return self._formatted[1]
+        msg = super().format(record)
+        self._formatted = (record, msg)
+        return msg
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            super().emit(record)
+        finally:
+            # don't keep the record alive.
+            self._formatted = None
+
+
+class _DeferredFlushRotatingFileHandler(_DeferredFlush, _RotatingFileHandler):
+    pass
+
+
+class _FlushTimer:
+    """Daemon thread that flushes registered handlers every `interval` seconds."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._handlers = weakref.WeakSet()
+        self._start()
+
+    def _start(self) -> None:
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"quicklogs-flush-{self.interval}s", daemon=True
+        )
+        self._thread.start()
+
+    def add(self, handler: logging.Handler) -> None:
+        with self._lock:
+            self._handlers.add(handler)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                handlers = list(self._handlers)
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    # stream may have been closed out from under the handler.
+                    pass
+
+
+_flush_timers: Dict[float, _FlushTimer] = {}
+_flush_timers_lock = threading.Lock()
+
+
+def _flush_timer(interval: float) -> _FlushTimer:
+    """Get the shared `_FlushTimer` for `interval`, starting it if needed."""
+    with _flush_timers_lock:
+        if (timer := _flush_timers.get(interval)) is None:
+            timer = _flush_timers[interval] = _FlushTimer(interval)
+        return timer
+
+
+def _restart_flush_timers() -> None:
+    # threads don't survive a fork, so the child needs its own flush threads.
+    global _flush_timers_lock
+    _flush_timers_lock = threading.Lock()
+    for timer in _flush_timers.values():
+        timer._start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_flush_timers)
+
+
+@lru_cache(maxsize=16)
+def _make_formatter(log_format: str) -> logging.Formatter:
+    """Formatters hold no per-record state, so loggers with the same format share one."""
+    return logging.Formatter(log_format)
+
+
+# (log format, flush interval, stream id) -> terminal handler shared by all loggers with that configuration.
+# handlers (and the streams they hold) are freed once no logger uses them.
+_stream_handlers = weakref.WeakValueDictionary()
+_stream_handlers_lock = threading.Lock()
+
+
+def _stream_handler(log_format: str, flush_interval: Optional[float]) -> _StreamHandler:
+    """Get the shared terminal handler for `log_format`, creating it if needed."""
+    # key on the current stream so loggers created after `sys.stderr` is replaced write to the new stream.
+    stream = sys.stderr
+    key = (log_format, flush_interval, id(stream))
+    with _stream_handlers_lock:
+        handler = _stream_handlers.get(key)
+        # the id may belong to a stream that has since been freed.
+        if handler is None or handler.stream is not stream:
+            if flush_interval:
+                handler = _DeferredFlushStreamHandler()
+                _flush_timer(flush_interval).add(handler)
+            else:
+                handler = _StreamHandler()
+            handler.setFormatter(_make_formatter(log_format))
+            _stream_handlers[key] = handler
+        return handler
+
+
+def _resolve(
+    env: Dict[str, Dict[str, str]],
+    name: Optional[str],
+    suffixes: Tuple[str, ...],
+    default=None,
+) -> Union[str, None]:
+    """Look up `{name}_{suffix}`, falling back to `QUICKLOGS_{suffix}`, for each of `suffixes` in order."""
+    if not env:
+        # no variables configure this logger.
+        return default
+    for prefix in (name, "QUICKLOGS") if name else ("QUICKLOGS",):
+        for suffix in suffixes:
+            if value := any_case_env_var(f"{prefix}_{suffix}", env=env):
+                return value
+    return default
+
+
+class LoggerConfig(NamedTuple):
+    """Fully resolved `get_logger` arguments."""
+
+    name: Optional[str]
+    level: int
+    no_terminal: Optional[bool]
+    file_dir: Optional[Union[str, Path]]
+    show_source: Optional[Literal["pathname", "filename"]]
+    file_max_bytes: Optional[int]
+    max_rotations: Optional[int]
+    file_buffer_size: Optional[int]
+    flush_interval: Optional[float]
+
+
+# logger name -> configuration of loggers that `get_logger` has configured.
+_configured: Dict[str, LoggerConfig] = {}
+
+
+def _handling_ancestor(name: str, cfg: LoggerConfig) -> Optional[Logger]:
+    """Find the nearest ancestor of logger `name` configured with the same handler options as `cfg`.
+
+    Only the logger name and level may differ. Returns None if another logger in between would also handle records.
+    """
+    loggers = logging.Logger.manager.loggerDict
+    parts = name.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        ancestor_name = ".".join(parts[:i])
+        ancestor = loggers.get(ancestor_name)
+        if not isinstance(ancestor, Logger):
+            # placeholder for a logger that hasn't been created.
+            continue
+        if (ancestor_cfg := _configured.get(ancestor_name)) is not None:
+            if ancestor_cfg._replace(name=name, level=cfg.level) != cfg:
+                return None
+            if ancestor.handlers and not ancestor.propagate:
+                return ancestor
+            if ancestor.handlers or not ancestor.propagate:
+                return None
+            # ancestor propagates to its own ancestor with the same configuration.
+            continue
+        if ancestor.handlers or not ancestor.propagate:
+            return None
+    return None
+
+
 def get_logger(
     name: Optional[str] = None,
     level: Optional[Union[str, int]] = None,
     no_terminal: Optional[bool] = None,
     file_dir: Optional[Union[str, Path]] = None,
     show_source: Optional[Literal["pathname", "filename"]] = None,
-    file_max_bytes: Optional[int] = 20_000_000,
-    max_rotations: Optional[int] = 2,
+    file_max_bytes: Optional[int] = None,
+    max_rotations: Optional[int] = None,
+    file_buffer_size: Optional[int] = None,
+    flush_interval: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+    backup_count: Optional[int] = None,
 ) -> Logger:
     """Create a new logger or return an existing logger with the given name.
 
@@ -39,80 +339,162 @@ def get_logger(
         show_source (Optional[bool], optional): `pathname`: Show absolute file path in log string prefix. `filename`: Show file name in log string prefix. Defaults to None.
         file_max_bytes (int): Max number of bytes to store in one log file. Defaults to 20MB.
         max_rotations (int): Number of log rotations to keep. Defaults to 2.
+        file_buffer_size (Optional[int], optional): Number of log records to buffer in memory before writing them to the log file. Records of level ERROR or higher are written immediately. Defaults to None (no buffering).
+        flush_interval (Optional[float], optional): Seconds between flushes of the terminal and file streams. If set, streams are flushed by a background thread instead of after every record. 0 means flush after every record. Defaults to None (flush after every record).
+        max_bytes (Optional[int], optional): Older name for `file_max_bytes`. Defaults to None.
+        backup_count (Optional[int], optional): Older name for `max_rotations`. Defaults to None.
 
     Returns:
         Logger: The configured logger.
     """
     logger = logging.getLogger(name)
-    # if this is not the first call, the logger will already have handlers.
-    if logger.handlers:
+    # if this is not the first call, the logger will already have handlers (or propagate to an ancestor's).
+    if logger.handlers or name in _configured:
         # return the already configured logger.
         return logger
 
-    if no_terminal is None:
-        if name:
-            no_terminal = any_case_env_var(f"{name}_NO_TERMINAL")
-        no_terminal = no_terminal or any_case_env_var("QUICKLOGS_NO_TERMINAL")
-
-    if file_dir is None:
-        if name:
-            file_dir = any_case_env_var(f"{name}_FILE_DIR")
-        file_dir = file_dir or any_case_env_var("QUICKLOGS_FILE_DIR")
-
-    if level is None:
-        if name:
-            level = any_case_env_var(f"{name}_LOG_LEVEL")
-        level = level or any_case_env_var("QUICKLOGS_LOG_LEVEL", logging.INFO)
-
-    if show_source is None:
-        if name:
-            show_source = any_case_env_var(f"{name}_SHOW_SOURCE")
-        show_source = show_source or any_case_env_var("QUICKLOGS_SHOW_SOURCE")
-
-    if file_max_bytes is None:
-        if name:
-            file_max_bytes = any_case_env_var(f"{name}_FILE_MAX_BYTES")
-        file_max_bytes = file_max_bytes or any_case_env_var("QUICKLOGS_FILE_MAX_BYTES")
-    if file_max_bytes:
-        file_max_bytes = int(file_max_bytes)
-
-    if max_rotations is None:
-        if name:
-            max_rotations = any_case_env_var(f"{name}_MAX_ROTATIONS")
-        max_rotations = max_rotations or any_case_env_var("QUICKLOGS_MAX_ROTATIONS")
-    if max_rotations:
-        max_rotations = int(max_rotations)
+    cfg = _resolve_config(
+        name,
+        no_terminal=no_terminal,
+        file_dir=file_dir,
+        level=level,
+        show_source=show_source,
+        file_max_bytes=max_bytes if file_max_bytes is None else file_max_bytes,
+        max_rotations=backup_count if max_rotations is None else max_rotations,
+        file_buffer_size=file_buffer_size,
+        flush_interval=flush_interval,
+    )
+    return _build_logger(logger, cfg)
+
+
+def _level_number(level: Union[str, int]) -> int:
+    if not isinstance(level, str):
+        return level
+    if (number := _LEVELS.get(level)) is not None:
+        return number
+    # levels added after import are only in the live registry.
+    if (number := logging._nameToLevel.get(level.upper())) is not None:
+        return number
+    raise ValueError(f"Unknown level: {level!r}")
+
+
+def _to_interval(value: Union[str, float]) -> Optional[float]:
+    if (interval := float(value)) < 0:
+        raise ValueError(f"flush_interval must not be negative, got {value!r}.")
+    # 0 means no interval.
+    return interval or None
+
+
+def _to_int(value: Union[str, int]) -> int:
+    # values from the environment are strings. defaults and most arguments are already ints.
+    return value if isinstance(value, int) else int(value)
+
+
+# (argument, environment variable suffixes, default, converter for non-empty values)
+# later suffixes are older names that are still accepted.
+_OPTIONS = (
+    ("no_terminal", ("NO_TERMINAL",), None, None),
+    ("file_dir", ("FILE_DIR",), None, None),
+    ("level", ("LOG_LEVEL",), logging.INFO, _level_number),
+    ("show_source", ("SHOW_SOURCE",), None, None),
+    ("file_max_bytes", ("FILE_MAX_BYTES", "MAX_BYTES"), 20_000_000, _to_int),
+    ("max_rotations", ("MAX_ROTATIONS", "BACKUP_COUNT"), 2, _to_int),
+    ("file_buffer_size", ("FILE_BUFFER_SIZE",), None, _to_int),
+    ("flush_interval", ("FLUSH_INTERVAL",), None, _to_interval),
+)
+
+
+@lru_cache(maxsize=128)
+def _resolve_config(name: Optional[str], **kwargs) -> LoggerConfig:
+    """Fill in arguments that were not explicitly set from environment variables.
+
+    Environment variables are assumed not to change during the process lifetime, so results are cached.
+    Call `_resolve_config.cache_clear()` to pick up changed variables.
+    """
+    # read the environment once for all option lookups, keeping only variables that could apply to this logger.
+    env = _case_insensitive_env((f"{name}_", "QUICKLOGS_") if name else ("QUICKLOGS_",))
+    values = {"name": name}
+    for arg, suffixes, default, convert in _OPTIONS:
+        value = kwargs[arg]
+        # log format (`show_source`) is only needed if a handler will be added.
+        if value is None and (
+            arg != "show_source" or values["file_dir"] or not values["no_terminal"]
+        ):
+            value = _resolve(env, name, suffixes, default)
+        if value and convert is not None:
+            value = convert(value)
+        values[arg] = value
+    return LoggerConfig(**values)
 
+
+def _build_logger(logger: Logger, cfg: LoggerConfig) -> Logger:
+    """Attach handlers to `logger` according to a resolved configuration."""
     # set log level.
-    logger.setLevel(
-        logging.getLevelName(level.upper()) if isinstance(level, str) else level
-    )
+    logger.setLevel(cfg.level)
+
+    if cfg.no_terminal and not cfg.file_dir:
+        # nothing to write to. also keeps records from reaching `logging.lastResort`.
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        return logger
+
+    if cfg.name and not cfg.file_dir and _handling_ancestor(cfg.name, cfg):
+        # an ancestor logger already writes to the terminal with this exact configuration,
+        # so let records propagate to its handlers instead of adding duplicate handlers.
+        logger.propagate = True
+        _configured[cfg.name] = cfg
+        return logger
 
     # set formatting and handling.
     log_format = "[%(asctime)s][%(levelname)s]"
-    if name:
+    if cfg.name:
         log_format += "[%(name)s]"
-    if show_source:
-        log_format += f"[%({show_source})s:%(lineno)d]"
+    if cfg.show_source:
+        log_format += f"[%({cfg.show_source})s:%(lineno)d]"
     log_format += " %(message)s"
-    formatter = logging.Formatter(log_format)
-    if not no_terminal:
-        handler = logging.StreamHandler()
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-    if file_dir:
-        file = Path(file_dir) / f"{name or f'python_{os.getpid()}'}.log"
+
+    handlers = []
+    if not cfg.no_terminal:
+        handlers.append(_stream_handler(log_format, cfg.flush_interval))
+
+    if cfg.file_dir:
+        file_dir = os.fspath(cfg.file_dir)
         # create log directory if it doesn't currently exist.
-        file.parent.mkdir(exist_ok=True, parents=True)
+        os.makedirs(file_dir, exist_ok=True)
+        file = os.path.join(file_dir, f"{cfg.name or f'python_{_PID}'}.log")
         # add file handler.
-        handler = RotatingFileHandler(
-            file, maxBytes=file_max_bytes, backupCount=max_rotations
+        handler_cls = (
+            _DeferredFlushRotatingFileHandler
+            if cfg.flush_interval
+            else _RotatingFileHandler
+        )
+        handler = handler_cls(
+            file, maxBytes=cfg.file_max_bytes, backupCount=cfg.max_rotations
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        handler.setFormatter(_make_formatter(log_format))
+        if cfg.flush_interval:
+            _flush_timer(cfg.flush_interval).add(handler)
+        if cfg.file_buffer_size:
+            # write records to the file in batches. `logging.shutdown` flushes the buffer at exit.
+            handler = MemoryHandler(
+                cfg.file_buffer_size,
+                flushLevel=logging.ERROR,
+                target=handler,
+                flushOnClose=True,
+            )
+            if cfg.flush_interval:
+                # drain the buffer periodically too.
+                _flush_timer(cfg.flush_interval).add(handler)
+        handlers.append(handler)
+
+    # attach all handlers with one acquisition of the module lock `addHandler` takes for each handler.
+    with logging._lock:
+        logger.handlers.extend(h for h in handlers if h not in logger.handlers)
 
     # don't duplicate log messages.
     logger.propagate = False
 
+    if cfg.name:
+        _configured[cfg.name] = cfg
+
     return logger
@@ -1,4 +1,7 @@
+import logging
 import os
+import sys
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from uuid import uuid4
@@ -54,3 +57,176 @@ def test_logger(use_env_vars):
         logger.info(random_uuid)
 
     assert len(list(file_dir.iterdir())) == backup_count + 1
+
+
+def test_child_logger_uses_ancestor_handlers():
+    name = f"test_parent_{uuid4().hex}"
+    parent = get_logger(name=name, level="INFO")
+    child = get_logger(name=f"{name}.child", level="DEBUG")
+    assert parent.handlers
+    assert not child.handlers
+    assert child.propagate
+    assert child.level == logging.DEBUG
+    # a different configuration gets its own handlers.
+    other = get_logger(name=f"{name}.other", show_source="filename")
+    assert other.handlers
+    assert not other.propagate
+
+
+def test_propagating_child_logger_is_not_reconfigured():
+    name = f"test_parent_{uuid4().hex}"
+    get_logger(name=name)
+    child = get_logger(name=f"{name}.child", level="DEBUG")
+    child.setLevel(logging.WARNING)
+    assert get_logger(name=f"{name}.child") is child
+    assert child.level == logging.WARNING
+    get_logger(name=f"{name}.child", show_source="filename")
+    assert not child.handlers
+    assert child.propagate
+    # grandchildren still find the handling ancestor through the propagating child.
+    grandchild = get_logger(name=f"{name}.child.grandchild")
+    assert not grandchild.handlers
+    assert grandchild.propagate
+
+
+def test_logger_without_output():
+    logger = get_logger(name=f"test_silent_{uuid4().hex}", no_terminal=True)
+    assert [type(h) for h in logger.handlers] == [logging.NullHandler]
+    assert not logger.propagate
+
+
+def test_terminal_output_order_with_redirected_stderr(tmp_path, monkeypatch):
+    path = tmp_path / "stderr.txt"
+    with open(path, "w") as stream:
+        monkeypatch.setattr(sys, "stderr", stream)
+        logger = get_logger(name=f"test_redirect_{uuid4().hex}")
+        print("line1", file=sys.stderr)
+        logger.warning("line2")
+        print("line3", file=sys.stderr)
+        monkeypatch.undo()
+    lines = path.read_text().splitlines()
+    assert lines[0] == "line1"
+    assert lines[1].endswith("line2")
+    assert lines[2] == "line3"
+
+
+def test_terminal_closed_stderr_is_not_written(tmp_path, monkeypatch):
+    stream = open(tmp_path / "stderr.txt", "w")
+    monkeypatch.setattr(sys, "stderr", stream)
+    logger = get_logger(name=f"test_closed_{uuid4().hex}")
+    monkeypatch.undo()
+    stream.close()
+    # likely reuses the closed stream's file descriptor.
+    with open(tmp_path / "unrelated.txt", "w") as unrelated:
+        logger.warning("leaked")
+    assert "leaked" not in (tmp_path / "unrelated.txt").read_text()
+
+
+def test_custom_level_name():
+    logging.addLevelName(5, "TRACE")
+    logger = get_logger(name=f"test_trace_{uuid4().hex}", level="trace")
+    assert logger.level == 5
+
+
+def test_unknown_level_name():
+    with pytest.raises(ValueError):
+        get_logger(name=f"test_level_{uuid4().hex}", level="nope")
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_flush_interval_defers_flush(tmp_path):
+    name = f"test_flush_{uuid4().hex}"
+    # long interval so the timer doesn't flush during the test.
+    logger = get_logger(
+        name=name, file_dir=tmp_path, no_terminal=True, flush_interval=3600
+    )
+    log_file = tmp_path / f"{name}.log"
+    logger.info("message")
+    assert log_file.read_text() == ""
+    logger.handlers[0].flush()
+    assert log_file.read_text().count("message") == 1
+
+
+def test_flush_interval_flushes_periodically(tmp_path):
+    name = f"test_flush_{uuid4().hex}"
+    logger = get_logger(
+        name=name, file_dir=tmp_path, no_terminal=True, flush_interval=0.05
+    )
+    log_file = tmp_path / f"{name}.log"
+    logger.info("message")
+    assert _wait_for(lambda: "message" in log_file.read_text())
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_flush_interval_after_fork(tmp_path):
+    name = f"test_flush_{uuid4().hex}"
+    logger = get_logger(
+        name=name, file_dir=tmp_path, no_terminal=True, flush_interval=0.05
+    )
+    log_file = tmp_path / f"{name}.log"
+    if (pid := os.fork()) == 0:
+        status = 1
+        try:
+            logger.info("child")
+            if _wait_for(lambda: "child" in log_file.read_text()):
+                status = 0
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert status == 0
+    assert "child" in log_file.read_text()
+
+
+def test_flush_interval_must_not_be_negative():
+    with pytest.raises(ValueError):
+        get_logger(name=f"test_flush_{uuid4().hex}", flush_interval=-1)
+
+
+def test_flush_interval_zero_from_env(tmp_path, monkeypatch):
+    name = f"test_flush_{uuid4().hex}"
+    monkeypatch.setenv(f"{name}_FLUSH_INTERVAL", "0")
+    logger = get_logger(name=name, file_dir=tmp_path, no_terminal=True)
+    logger.info("message")
+    # written immediately, without a flush interval.
+    assert "message" in (tmp_path / f"{name}.log").read_text()
+
+
+def test_file_buffer_size(tmp_path):
+    name = f"test_buffer_{uuid4().hex}"
+    logger = get_logger(
+        name=name, file_dir=tmp_path, no_terminal=True, file_buffer_size=3
+    )
+    log_file = tmp_path / f"{name}.log"
+    logger.info("first")
+    logger.info("second")
+    assert log_file.read_text() == ""
+    # errors flush the buffer immediately.
+    logger.error("third")
+    assert len(log_file.read_text().splitlines()) == 3
+    logger.info("fourth")
+    assert len(log_file.read_text().splitlines()) == 3
+    # closing drains the buffer.
+    (handler,) = logger.handlers
+    handler.close()
+    assert "fourth" in log_file.read_text()
+
+
+def test_mixed_case_env_var(monkeypatch):
+    name = f"MyLogger_{uuid4().hex}"
+    monkeypatch.setenv(f"{name}_Log_Level", "debug")
+    assert get_logger(name=name).level == logging.DEBUG
+
+
+def test_exact_case_env_var_preferred(monkeypatch):
+    name = f"foo_{uuid4().hex}"
+    monkeypatch.setenv(f"{name}_LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv(f"{name.upper()}_LOG_LEVEL", "ERROR")
+    assert get_logger(name=name).level == logging.DEBUG